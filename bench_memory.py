@@ -0,0 +1,50 @@
+import sys
+import os
+import gc
+import tracemalloc
+
+COUNTS = (1000, 10000)
+
+
+def measure(factory, count):
+    # Bytes of Python heap retained per entity, including anything it allocates itself.
+    # SDL surface and mixer memory is not traced, but it is shared across entities.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from game.player import Player
+    from game.laser import Laser
+    from game.saucer import Saucer
+
+    pygame.init()
+    width, height = 1280, 720
+    # Build the shared ship surface and sound buffers up front so they aren't
+    # charged to the first entity measured
+    Player(width, height)
+
+    factories = {
+        "player": lambda i: Player(width, height),
+        "laser": lambda i: Laser((i % width, i % height), (0.0, -10.0), 0),
+        "saucer": lambda i: Saucer(width, height),
+    }
+    print(f"{'entity':<8} " + " ".join(f"{f'{n} x':>12}" for n in COUNTS))
+    for name, factory in factories.items():
+        sizes = [measure(factory, n) for n in COUNTS]
+        print(f"{name:<8} " + " ".join(f"{size:>10.0f} B" for size in sizes))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(__file__))
+    main()
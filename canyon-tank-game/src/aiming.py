@@ -0,0 +1,230 @@
+import queue
+import threading
+import time
+
+import numpy as np
+
+GRAVITY = 0.25        # px / frame^2, pulls shells down the screen
+MAX_FLIGHT_FRAMES = 600
+YIELD_EVERY = 8       # flight frames between deadline checks / GIL yields
+PENDING = object()  # returned by AimingWorker.poll while a solve is in flight, and by
+                    # FiringSolver.cached when nothing is cached
+
+
+class FiringSolver:
+    """Pick an (angle, power) that lands a shell near a target.
+
+    The terrain is a heightfield: ``heights[x]`` is the screen-space y of the
+    ground surface in column ``x`` (y grows downwards). Angles follow the same
+    convention as the space game: 0 is straight up, positive tilts right, in
+    degrees. Wind is a horizontal acceleration added every frame.
+    """
+
+    def __init__(self, heights, gravity=GRAVITY, min_angle=-85, max_angle=85,
+                 min_power=2.0, max_power=20.0, angle_steps=64, power_steps=48,
+                 refine_count=4, refine_steps=12, position_bucket=8, wind_bucket=0.01):
+        self.gravity = gravity
+        self.min_angle = min_angle
+        self.max_angle = max_angle
+        self.min_power = min_power
+        self.max_power = max_power
+        self.angle_steps = angle_steps
+        self.power_steps = power_steps
+        self.refine_count = refine_count
+        self.refine_steps = refine_steps
+        self.position_bucket = position_bucket
+        self.wind_bucket = wind_bucket
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.set_terrain(heights)
+
+    def set_terrain(self, heights):
+        # Cached solutions are only valid for the terrain they were solved on
+        with self._lock:
+            self.heights = np.asarray(heights, dtype=np.float64)
+            self.width = len(self.heights)
+            self._cache.clear()
+
+    def cache_key(self, shooter, target, wind):
+        pb = self.position_bucket
+        return (
+            int(shooter[0] // pb), int(shooter[1] // pb),
+            int(target[0] // pb), int(target[1] // pb),
+            int(round(wind / self.wind_bucket)),
+        )
+
+    def cached(self, shooter, target, wind):
+        """Return the cached solve result (possibly None), or PENDING if there is none."""
+        with self._lock:
+            return self._cache.get(self.cache_key(shooter, target, wind), PENDING)
+
+    def solve(self, shooter, target, wind=0.0, deadline=None):
+        """Return ``(angle, power, miss_px)`` or None if nothing lands.
+
+        ``deadline`` is a ``time.perf_counter()`` value. It is checked inside
+        the flight simulation as well as between refinement passes; a solve cut
+        short returns the best shot found so far and is not cached.
+        """
+        key = self.cache_key(shooter, target, wind)
+        with self._lock:
+            heights = self.heights
+            hit = self._cache.get(key, PENDING)
+        if hit is not PENDING:
+            return hit
+
+        angles = np.linspace(self.min_angle, self.max_angle, self.angle_steps)
+        powers = np.linspace(self.min_power, self.max_power, self.power_steps)
+        grid_a, grid_p = np.meshgrid(angles, powers)
+        cand_a = grid_a.ravel()
+        cand_p = grid_p.ravel()
+        miss, complete = self._miss_distance(heights, shooter, target, wind, cand_a, cand_p, deadline)
+
+        a_span = (self.max_angle - self.min_angle) / max(1, self.angle_steps - 1)
+        p_span = (self.max_power - self.min_power) / max(1, self.power_steps - 1)
+        while complete:
+            if deadline is not None and time.perf_counter() >= deadline:
+                # Refinement was cut short; the shot is usable but not the best we can do
+                complete = False
+                break
+            best = np.argsort(miss)[:self.refine_count]
+            if not np.isfinite(miss[best[0]]) or miss[best[0]] < 1.0:
+                break
+            # Zoom a finer local grid around each of the best candidates
+            local = np.linspace(-1.0, 1.0, self.refine_steps)
+            da, dp = np.meshgrid(local * a_span, local * p_span)
+            ref_a = np.clip((cand_a[best, None] + da.ravel()).ravel(), self.min_angle, self.max_angle)
+            ref_p = np.clip((cand_p[best, None] + dp.ravel()).ravel(), self.min_power, self.max_power)
+            ref_miss, complete = self._miss_distance(heights, shooter, target, wind, ref_a, ref_p, deadline)
+            cand_a = np.concatenate((cand_a[best], ref_a))
+            cand_p = np.concatenate((cand_p[best], ref_p))
+            miss = np.concatenate((miss[best], ref_miss))
+            a_span /= self.refine_steps / 2
+            p_span /= self.refine_steps / 2
+            if a_span < 1e-3 and p_span < 1e-3:
+                break
+
+        i = int(np.argmin(miss))
+        result = None
+        if np.isfinite(miss[i]):
+            result = (float(cand_a[i]), float(cand_p[i]), float(miss[i]))
+        # A result from a solve cut short by the deadline may have missed a
+        # better (or the only) landing, so it is returned but not cached.
+        # Unsolvable shots are cached as None so they aren't re-solved.
+        if complete:
+            with self._lock:
+                # Don't store a solution computed against terrain that has since changed
+                if self.heights is heights:
+                    self._cache[key] = result
+        return result
+
+    def simulate(self, heights, shooter, wind, angles, powers, deadline=None):
+        """Fly every candidate shell at once; return impact x, impact y and a completion flag.
+
+        Shells that leave the sides of the map or never land are NaN. If
+        ``deadline`` passes mid-flight the shells still airborne are NaN and the
+        flag is False.
+        """
+        rad = np.radians(angles)
+        n = len(rad)
+        x = np.full(n, float(shooter[0]))
+        y = np.full(n, float(shooter[1]))
+        vx = np.sin(rad) * powers
+        vy = -np.cos(rad) * powers
+        impact_x = np.full(n, np.nan)
+        impact_y = np.full(n, np.nan)
+        flying = np.ones(n, dtype=bool)
+        # Use the snapshot's width; set_terrain may have swapped the live terrain
+        last_col = len(heights) - 1
+        for frame in range(MAX_FLIGHT_FRAMES):
+            if frame % YIELD_EVERY == 0 and frame:
+                # Let the game thread have the GIL between batches of small numpy steps
+                time.sleep(0)
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return impact_x, impact_y, False
+            vx += wind
+            vy += self.gravity
+            x += vx
+            y += vy
+            out = flying & ((x < 0) | (x > last_col))
+            flying &= ~out
+            ground = heights[np.clip(x, 0, last_col).astype(np.intp)]
+            landed = flying & (y >= ground)
+            impact_x[landed] = x[landed]
+            impact_y[landed] = ground[landed]
+            flying &= ~landed
+            if not flying.any():
+                break
+        return impact_x, impact_y, True
+
+    def _miss_distance(self, heights, shooter, target, wind, angles, powers, deadline=None):
+        impact_x, impact_y, complete = self.simulate(heights, shooter, wind, angles, powers, deadline)
+        miss = np.hypot(impact_x - target[0], impact_y - target[1])
+        miss[np.isnan(miss)] = np.inf
+        return miss, complete
+
+
+class AimingWorker:
+    """Runs a FiringSolver on a background thread so AI turns never stall a frame.
+
+    Call ``request`` when an AI tank starts its turn, then ``poll`` each frame
+    until it returns a solution.
+    """
+
+    def __init__(self, solver, time_budget=0.05):
+        self.solver = solver
+        self.time_budget = time_budget
+        self.running = False
+        self.lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._results = {}
+        self._sequence = {}  # tank_id -> number of its latest request
+        self._thread = None
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self._solve_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        self._requests.put(None)
+
+    def request(self, tank_id, shooter, target, wind=0.0):
+        # Each request supersedes any earlier one still queued or in flight for this tank
+        hit = self.solver.cached(shooter, target, wind)
+        with self.lock:
+            seq = self._sequence.get(tank_id, 0) + 1
+            self._sequence[tank_id] = seq
+            if hit is not PENDING:
+                # Cache hits are answered immediately without a round trip to the worker
+                self._results[tank_id] = hit
+                return
+            self._results.pop(tank_id, None)
+        self._requests.put((tank_id, seq, shooter, target, wind))
+
+    def poll(self, tank_id):
+        """Return ``(angle, power, miss_px)``, None for no solution, or PENDING."""
+        with self.lock:
+            return self._results.pop(tank_id, PENDING)
+
+    def _solve_loop(self):
+        while self.running:
+            job = self._requests.get()
+            if job is None:
+                continue
+            tank_id, seq, shooter, target, wind = job
+            if not self._is_latest(tank_id, seq):
+                continue
+            deadline = time.perf_counter() + self.time_budget
+            try:
+                result = self.solver.solve(shooter, target, wind, deadline=deadline)
+            except Exception:
+                # A failed job answers "no solution" rather than killing the worker
+                result = None
+            with self.lock:
+                if self._sequence.get(tank_id) == seq:
+                    self._results[tank_id] = result
+
+    def _is_latest(self, tank_id, seq):
+        with self.lock:
+            return self._sequence.get(tank_id) == seq
@@ -0,0 +1,173 @@
+import math
+import threading
+import time
+
+import numpy as np
+
+from aiming import FiringSolver, AimingWorker, PENDING
+
+
+def make_terrain(width=1000):
+    return 600 - 100 * np.sin(np.linspace(0, 6, width))
+
+
+def landing(solver, shooter, wind, angle, power):
+    impact_x, impact_y, complete = solver.simulate(
+        solver.heights, shooter, wind, np.array([angle]), np.array([power]))
+    assert complete
+    return impact_x[0], impact_y[0]
+
+
+def wait_for(worker, tank_id, timeout=5.0):
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        result = worker.poll(tank_id)
+        if result is not PENDING:
+            return result
+        time.sleep(0.005)
+    raise AssertionError("worker never answered")
+
+
+def test_solution_lands_within_reported_miss():
+    heights = make_terrain()
+    solver = FiringSolver(heights)
+    shooter = (100, heights[100] - 5)
+    target = (800, heights[800])
+    angle, power, miss_px = solver.solve(shooter, target, wind=0.02)
+    x, y = landing(solver, shooter, 0.02, angle, power)
+    assert math.hypot(x - target[0], y - target[1]) <= miss_px + 1e-6
+    assert miss_px < 5
+
+
+def test_unsolvable_shot_is_cached_as_none():
+    # Ground far below anything a shell can reach: nothing ever lands
+    solver = FiringSolver(np.full(200, 1e9))
+    assert solver.solve((100, 0), (150, 1e9)) is None
+    assert solver.cached((100, 0), (150, 1e9), 0.0) is None
+
+
+def test_set_terrain_clears_cache():
+    heights = make_terrain()
+    solver = FiringSolver(heights)
+    shooter = (100, heights[100] - 5)
+    target = (800, heights[800])
+    solver.solve(shooter, target)
+    assert solver.cached(shooter, target, 0.0) is not PENDING
+    solver.set_terrain(heights + 50)
+    assert solver.cached(shooter, target, 0.0) is PENDING
+
+
+def test_rerequest_returns_latest_answer():
+    heights = make_terrain(1400)
+    solver = FiringSolver(heights)
+    worker = AimingWorker(solver, time_budget=2.0)
+    worker.start()
+    try:
+        shooter = (50, heights[50] - 5)
+        far = (1200, heights[1200])
+        near = (300, heights[300])
+        worker.request(9, shooter, far)
+        worker.request(9, shooter, near)
+        angle, power, _ = wait_for(worker, 9)
+        x, _ = landing(solver, shooter, 0.0, angle, power)
+        assert abs(x - near[0]) < 10
+    finally:
+        worker.stop()
+
+
+class BlockingSolver(FiringSolver):
+    """Holds every solve until ``release`` is set, so a test can act mid-solve."""
+
+    def __init__(self, heights):
+        super().__init__(heights)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def solve(self, shooter, target, wind=0.0, deadline=None):
+        self.started.set()
+        assert self.release.wait(5.0)
+        return super().solve(shooter, target, wind, deadline)
+
+
+class CoarseOnlySolver(FiringSolver):
+    """Runs the coarse grid to completion, so a past deadline expires between passes."""
+
+    def __init__(self, heights):
+        super().__init__(heights)
+        self.passes = 0
+
+    def _miss_distance(self, heights, shooter, target, wind, angles, powers, deadline=None):
+        self.passes += 1
+        return super()._miss_distance(heights, shooter, target, wind, angles, powers, None)
+
+
+class FailingSolver(FiringSolver):
+    def solve(self, shooter, target, wind=0.0, deadline=None):
+        if target[0] == 666:
+            raise IndexError("boom")
+        return super().solve(shooter, target, wind, deadline)
+
+
+def test_cache_hit_supersedes_job_in_flight():
+    heights = make_terrain(1400)
+    solver = BlockingSolver(heights)
+    shooter = (50, heights[50] - 5)
+    near = (300, heights[300])
+    solver.release.set()
+    expected = solver.solve(shooter, near)
+    solver.release.clear()
+    solver.started.clear()
+    worker = AimingWorker(solver, time_budget=2.0)
+    worker.start()
+    try:
+        worker.request(9, shooter, (1200, heights[1200]))
+        assert solver.started.wait(5.0)
+        # The far solve is now in flight; a cache hit must supersede it
+        worker.request(9, shooter, near)
+        assert worker.poll(9) == expected
+        solver.release.set()
+        # The worker handles jobs in order, so once tank 10 is answered the
+        # superseded solve for tank 9 has finished and must not have published
+        worker.request(10, shooter, (800, heights[800]))
+        wait_for(worker, 10)
+        assert worker.poll(9) is PENDING
+    finally:
+        worker.stop()
+
+
+def test_deadline_between_passes_is_not_cached():
+    heights = make_terrain()
+    solver = CoarseOnlySolver(heights)
+    shooter = (100, heights[100] - 5)
+    target = (800, heights[800])
+    # Already expired: the coarse grid completes, then refinement must stop
+    result = solver.solve(shooter, target, deadline=0.0)
+    assert result is not None
+    assert solver.passes == 1
+    assert solver.cached(shooter, target, 0.0) is PENDING
+    full = solver.solve(shooter, target)
+    assert full[2] <= result[2]
+    assert solver.cached(shooter, target, 0.0) == full
+
+
+def test_simulate_uses_snapshot_width():
+    solver = FiringSolver(make_terrain(1280))
+    narrow = make_terrain(500)
+    impact_x, _, complete = solver.simulate(
+        narrow, (250, narrow[250] - 5), 0.0, np.array([60.0, -60.0]), np.array([20.0, 20.0]))
+    assert complete
+    assert np.all(np.isnan(impact_x) | (impact_x <= 499))
+
+
+def test_failed_job_answers_none_and_worker_survives():
+    heights = make_terrain()
+    worker = AimingWorker(FailingSolver(heights), time_budget=2.0)
+    worker.start()
+    try:
+        shooter = (100, heights[100] - 5)
+        worker.request(1, shooter, (666, heights[666]))
+        assert wait_for(worker, 1) is None
+        worker.request(2, shooter, (800, heights[800]))
+        assert wait_for(worker, 2) is not None
+    finally:
+        worker.stop()
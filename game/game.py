@@ -1,6 +1,8 @@
 import pygame
 from .player import Player
 from .network import NetworkManager
+from .sound import AudioScheduler
+from .render import RenderPass
 import socket
 import random
 
@@ -49,6 +51,7 @@ class Game:
         self.running = True
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
+        self.audio = AudioScheduler.shared()
         self.player = Player(self.screen_width, self.screen_height)
         # Use hostname:port as a simple unique id
         self.player_id = f"{socket.gethostname()}_{socket.gethostbyname(socket.gethostname())}"
@@ -56,10 +59,13 @@ class Game:
         self.network.start()
         self.remote_players = {}  # key: peer_id, value: Player
         self.starfield = Starfield(self.screen_width, self.screen_height)
+        self.render = RenderPass(self.screen_width, self.screen_height)
 
     def run(self):
         font = pygame.font.Font(None, 36)
         while self.running:
+            # Roll the audio counters before events so SPACE-fired lasers land in this frame
+            self.audio.begin_frame(self.player.pos)
             self._handle_events()
             self._update()
             self._draw(font)
@@ -98,6 +104,11 @@ class Game:
         for remote in self.remote_players.values():
             remote.draw(self.screen)
 
+        # Saucers live in world space; cull and draw them relative to the local player
+        self.render.begin_frame(self.player.pos)
+        saucers = [self.player.saucer] + [remote.saucer for remote in self.remote_players.values()]
+        self.render.draw_saucers(self.screen, saucers)
+
         # Show detected peers
         y = 10
         self.screen.blit(font.render("Peers on LAN:", True, (255,255,0)), (10, y))
@@ -1,10 +1,14 @@
 import pygame
 import math
+import array
 
 class Laser:
+    __slots__ = ('pos', 'vel', 'angle')
+
     def __init__(self, pos, vel, angle):
-        self.pos = list(pos)
-        self.vel = list(vel)
+        # Flat double arrays avoid a list plus two boxed floats per vector
+        self.pos = array.array('d', pos)
+        self.vel = array.array('d', vel)
         self.angle = angle
 
     def update(self):
@@ -7,11 +7,20 @@ from .laser import Laser
 from .saucer import Saucer
 
 class Player:
+    __slots__ = (
+        'screen_width', 'screen_height', 'pos', 'vel', 'angle', 'thrust', 'friction',
+        'lasers', 'tilt', '_tilt_target', '_tilt_speed', '_last_thrusting', '_sound', '_saucer',
+    )
+    # Built once by _init_ship_surface and shared by all players
+    ship_surf = None
+    _thruster_geom = ()
+    _laser_tip_offset = (0, 0)
+
     def __init__(self, screen_width, screen_height, sound_manager=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.pos = [0.0, 0.0]
-        self.vel = [0.0, 0.0]
+        self.pos = array.array('d', (0.0, 0.0))
+        self.vel = array.array('d', (0.0, 0.0))
         self.angle = 0  # 0 is up, in degrees
         self.thrust = 0.3
         self.friction = 0.98
@@ -19,16 +28,21 @@ class Player:
         self.tilt = 0
         self._tilt_target = 0
         self._tilt_speed = 2  # degrees per frame
-        self._thruster_geom = []
+        self._last_thrusting = False
         self._sound = sound_manager or SoundManager()
         self._saucer = Saucer(screen_width, screen_height)
         self._init_ship_surface()
 
-    def _init_ship_surface(self):
-        # Draw the entire ship as a single surface, facing up (angle 0)
+    @classmethod
+    def _init_ship_surface(cls):
+        # Draw the entire ship as a single surface, facing up (angle 0).
+        # Every player shares the same 160x160 RGBA surface and geometry.
+        if cls.ship_surf is not None:
+            return
+        thruster_geom = []
         scale = 2
         surf_size = 80 * scale
-        self.ship_surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+        ship_surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
         cx, cy = surf_size // 2, surf_size // 2
 
         # Body
@@ -37,39 +51,39 @@ class Player:
             (6, 18), (10, 6), (18, 0), (8, -10)
         ]
         body_points = [(cx + x * scale, cy + y * scale) for (x, y) in body_points]
-        pygame.draw.polygon(self.ship_surf, (80, 200, 255), body_points)
-        pygame.draw.polygon(self.ship_surf, (40, 80, 180), body_points, 2)
+        pygame.draw.polygon(ship_surf, (80, 200, 255), body_points)
+        pygame.draw.polygon(ship_surf, (40, 80, 180), body_points, 2)
 
         # Cockpit
         cockpit_rect = pygame.Rect(cx - 7*scale, cy - 8*scale - 12*scale, 14*scale, 14*scale)
-        pygame.draw.ellipse(self.ship_surf, (120, 240, 255), cockpit_rect)
-        pygame.draw.ellipse(self.ship_surf, (180, 240, 255), cockpit_rect, 2)
+        pygame.draw.ellipse(ship_surf, (120, 240, 255), cockpit_rect)
+        pygame.draw.ellipse(ship_surf, (180, 240, 255), cockpit_rect, 2)
         highlight_rect = cockpit_rect.inflate(-6*scale, -8*scale)
-        pygame.draw.arc(self.ship_surf, (255, 255, 255), highlight_rect, math.radians(200), math.radians(320), 2)
+        pygame.draw.arc(ship_surf, (255, 255, 255), highlight_rect, math.radians(200), math.radians(320), 2)
 
         # Tiny pilot helmet
         helmet_radius = int(2.2 * scale)
         helmet_center = (cx, cy - 12*scale)
-        pygame.draw.circle(self.ship_surf, (220, 220, 230), helmet_center, helmet_radius)
+        pygame.draw.circle(ship_surf, (220, 220, 230), helmet_center, helmet_radius)
         visor_rect = pygame.Rect(
             helmet_center[0] - helmet_radius, helmet_center[1] - helmet_radius, helmet_radius*2, helmet_radius*2
         )
-        pygame.draw.arc(self.ship_surf, (100, 180, 255), visor_rect, math.radians(210), math.radians(330), max(1, scale))
+        pygame.draw.arc(ship_surf, (100, 180, 255), visor_rect, math.radians(210), math.radians(330), max(1, scale))
 
         # Thrusters
         for tx in [-7, 7]:
             thruster_center = (cx + tx*scale, cy + 18*scale)
             thruster_rect = pygame.Rect(0, 0, 7*scale, 14*scale)
             thruster_rect.center = thruster_center
-            pygame.draw.ellipse(self.ship_surf, (180, 180, 180), thruster_rect)
-            pygame.draw.ellipse(self.ship_surf, (80, 80, 80), thruster_rect, 2)
+            pygame.draw.ellipse(ship_surf, (180, 180, 180), thruster_rect)
+            pygame.draw.ellipse(ship_surf, (80, 80, 80), thruster_rect, 2)
             for bolt_angle in [0, 120, 240]:
                 bolt_rad = math.radians(bolt_angle)
                 bolt_x = thruster_center[0] + 3*scale * math.cos(bolt_rad)
                 bolt_y = thruster_center[1] + 6*scale * math.sin(bolt_rad)
-                pygame.draw.circle(self.ship_surf, (60, 60, 60), (int(bolt_x), int(bolt_y)), scale)
+                pygame.draw.circle(ship_surf, (60, 60, 60), (int(bolt_x), int(bolt_y)), scale)
             # Save local thruster center for glow calculation
-            self._thruster_geom.append((tx * scale, 18 * scale, 14 * scale))  # (local_x, local_y, length)
+            thruster_geom.append((tx * scale, 18 * scale, 14 * scale))  # (local_x, local_y, length)
 
         # Laser cannons: fused, skinnier, embedded, and shorter
         barrel_length = 5 * scale  # shorter
@@ -94,8 +108,8 @@ class Player:
             (embed_tip[0] - perp[0], embed_tip[1] - perp[1]),
             (embed_tip[0] + perp[0], embed_tip[1] + perp[1]),
         ]
-        pygame.draw.polygon(self.ship_surf, (60, 100, 140), embed_poly)
-        pygame.draw.polygon(self.ship_surf, (100, 140, 180), embed_poly, 1)
+        pygame.draw.polygon(ship_surf, (60, 100, 140), embed_poly)
+        pygame.draw.polygon(ship_surf, (100, 140, 180), embed_poly, 1)
         # Exposed section (rest of barrel)
         exposed_poly = [
             (embed_tip[0] + perp[0], embed_tip[1] + perp[1]),
@@ -103,17 +117,19 @@ class Player:
             (tip_center[0] - perp[0], tip_center[1] - perp[1]),
             (tip_center[0] + perp[0], tip_center[1] + perp[1]),
         ]
-        pygame.draw.polygon(self.ship_surf, (120, 120, 120), exposed_poly)
-        pygame.draw.polygon(self.ship_surf, (180, 180, 180), exposed_poly, 1)
-        pygame.draw.circle(self.ship_surf, (120, 120, 120), (int(embed_tip[0]), int(embed_tip[1])), int(barrel_width // 2), 1)
-        pygame.draw.circle(self.ship_surf, (255, 220, 180), (int(tip_center[0]), int(tip_center[1])), int(2*scale))
+        pygame.draw.polygon(ship_surf, (120, 120, 120), exposed_poly)
+        pygame.draw.polygon(ship_surf, (180, 180, 180), exposed_poly, 1)
+        pygame.draw.circle(ship_surf, (120, 120, 120), (int(embed_tip[0]), int(embed_tip[1])), int(barrel_width // 2), 1)
+        pygame.draw.circle(ship_surf, (255, 220, 180), (int(tip_center[0]), int(tip_center[1])), int(2*scale))
         # Store the laser tip position for firing
-        self._laser_tip_offset = (0, -(18 + barrel_length)*scale)
+        cls._laser_tip_offset = (0, -(18 + barrel_length)*scale)
+        cls._thruster_geom = tuple(thruster_geom)
+        cls.ship_surf = ship_surf
 
     def update(self, keys):
         self._update_tilt(keys)
         thrusting = (keys[pygame.K_w] or keys[pygame.K_UP] or keys[pygame.K_s] or keys[pygame.K_DOWN])
-        self._sound.play_move(thrusting)
+        self._sound.play_move(thrusting, self.pos)
         self._apply_controls(keys)
         self._apply_friction()
         self._update_position()
@@ -146,7 +162,10 @@ class Player:
         self._draw_thruster_glow(screen, rect, self._last_thrusting)
         for laser in self.lasers:
             laser.draw(screen)
-        self._saucer.draw(screen, self.pos)
+
+    @property
+    def saucer(self):
+        return self._saucer
 
     def _draw_thruster_glow(self, screen, rect, show_glow):
         if not show_glow:
@@ -239,4 +258,4 @@ class Player:
         vy = -math.cos(rad) * laser_speed
         laser = Laser([laser_x, laser_y], [vx, vy], self.angle - self.tilt)
         self.lasers.append(laser)
-        self._sound.play_laser()
+        self._sound.play_laser(self.pos)
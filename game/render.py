@@ -0,0 +1,73 @@
+import pygame
+import math
+
+from .saucer import Saucer
+
+class RenderPass:
+    """Draws world-space entities relative to the camera (the local player).
+
+    The camera offset is computed once per frame, and anything whose bounds
+    miss the viewport is culled before any draw call. ``drawn`` and
+    ``culled`` count entities for the current frame.
+    """
+
+    def __init__(self, screen_width, screen_height):
+        self.viewport = pygame.Rect(0, 0, screen_width, screen_height)
+        self._offset = (0.0, 0.0)
+        self._beam_strip = None
+        self.drawn = 0
+        self.culled = 0
+
+    def begin_frame(self, camera_pos):
+        self._offset = (self.viewport.centerx - camera_pos[0], self.viewport.centery - camera_pos[1])
+        self.drawn = 0
+        self.culled = 0
+
+    def to_screen(self, pos):
+        return pos[0] + self._offset[0], pos[1] + self._offset[1]
+
+    def draw_saucers(self, screen, saucers):
+        viewport = self.viewport
+        for saucer in saucers:
+            sx, sy = self.to_screen(saucer.pos)
+            r = saucer.bounds_radius()
+            body_visible = viewport.colliderect((sx - r, sy - r, 2 * r, 2 * r))
+            # The beam reaches far past the body, so it is tested on its own
+            beam = saucer.beam_segment(sx, sy)
+            visible_beam = beam and viewport.clipline(beam[0], beam[1])
+            if not body_visible and not visible_beam:
+                self.culled += 1
+                continue
+            self.drawn += 1
+            if body_visible:
+                saucer.draw_body(screen, sx, sy)
+            if visible_beam:
+                self._draw_beam(screen, saucer.laser, beam, visible_beam)
+
+    def _draw_beam(self, screen, beam, segment, visible):
+        strip = self._get_beam_strip()
+        if beam.strip is None:
+            # A beam keeps its angle for its whole life, so it is rotated once
+            # per shot. The strip runs along +x; the beam heads (sin a, -cos a)
+            # on screen. RLE lets blits skip the transparent corners cheaply.
+            beam.strip = pygame.transform.rotate(strip, 90 - math.degrees(beam.angle))
+            beam.strip.set_alpha(255, pygame.RLEACCEL)
+        (x1, y1), (x2, y2) = segment
+        rect = beam.strip.get_rect(center=((x1 + x2) / 2, (y1 + y2) / 2))
+        # Only blit the part of the strip around the on-screen piece of the beam
+        (vx1, vy1), (vx2, vy2) = visible
+        pad = strip.get_height()
+        area = pygame.Rect(min(vx1, vx2), min(vy1, vy2), abs(vx2 - vx1) + 1, abs(vy2 - vy1) + 1)
+        area = area.inflate(pad, pad).clip(rect)
+        screen.blit(beam.strip, area.topleft, area.move(-rect.x, -rect.y))
+
+    def _get_beam_strip(self):
+        if self._beam_strip is None:
+            length = Saucer.BEAM_LENGTH - Saucer.BEAM_START
+            # Alpha per row: soft glow on the edges, solid 4 px core
+            rows = (20, 40, 80, 255, 255, 255, 255, 80, 40, 20)
+            strip = pygame.Surface((length, len(rows)), pygame.SRCALPHA)
+            for y, alpha in enumerate(rows):
+                strip.fill((255, 0, 255, alpha), (0, y, length, 1))
+            self._beam_strip = strip
+        return self._beam_strip
@@ -1,9 +1,28 @@
 import pygame
 import math
 import random
-import pygame.gfxdraw
+import array
+
+from .sound import AudioScheduler, PRIORITY_EXPLOSION
+
+class SaucerBeam:
+    __slots__ = ('angle', 'life', 'strip')
+
+    def __init__(self, angle, life):
+        self.angle = angle
+        self.life = life
+        self.strip = None  # rotated glow strip, built by RenderPass on first draw
 
 class Saucer:
+    __slots__ = (
+        'screen_width', 'screen_height', 'pos', 'vel', 'radius', 'charge', 'charge_max',
+        'laser_cooldown', 'laser', 'target_pos', 'exploding', 'explosion_timer',
+        'explosion_duration', 'explosion_sound',
+    )
+    _shared_explosion_sound = False  # loaded once for all saucers on first use
+    BEAM_START = 32     # beam starts at the rim of the saucer
+    BEAM_LENGTH = 900
+
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -18,11 +37,16 @@ class Saucer:
         self.exploding = False
         self.explosion_timer = 0
         self.explosion_duration = 40
-        self.explosion_sound = None
-        try:
-            self.explosion_sound = pygame.mixer.Sound("assets/explosion.wav")
-        except Exception:
-            self.explosion_sound = None
+        self.explosion_sound = self._load_explosion_sound()
+
+    @classmethod
+    def _load_explosion_sound(cls):
+        if cls._shared_explosion_sound is False:
+            try:
+                cls._shared_explosion_sound = pygame.mixer.Sound("assets/explosion.wav")
+            except Exception:
+                cls._shared_explosion_sound = None
+        return cls._shared_explosion_sound
 
     def _spawn_near_screen(self, center):
         # Pick a random side and spawn just outside the visible area, aimed inward
@@ -30,17 +54,17 @@ class Saucer:
         cx, cy = center
         side = random.choice(['left', 'right', 'top', 'bottom'])
         if side == 'left':
-            self.pos = [cx - self.screen_width//2 - margin, cy + random.randint(-self.screen_height//2, self.screen_height//2)]
-            self.vel = [random.uniform(2, 3), random.uniform(-1, 1)]
+            self.pos = array.array('d', [cx - self.screen_width//2 - margin, cy + random.randint(-self.screen_height//2, self.screen_height//2)])
+            self.vel = array.array('d', [random.uniform(2, 3), random.uniform(-1, 1)])
         elif side == 'right':
-            self.pos = [cx + self.screen_width//2 + margin, cy + random.randint(-self.screen_height//2, self.screen_height//2)]
-            self.vel = [-random.uniform(2, 3), random.uniform(-1, 1)]
+            self.pos = array.array('d', [cx + self.screen_width//2 + margin, cy + random.randint(-self.screen_height//2, self.screen_height//2)])
+            self.vel = array.array('d', [-random.uniform(2, 3), random.uniform(-1, 1)])
         elif side == 'top':
-            self.pos = [cx + random.randint(-self.screen_width//2, self.screen_width//2), cy - self.screen_height//2 - margin]
-            self.vel = [random.uniform(-1, 1), random.uniform(2, 3)]
+            self.pos = array.array('d', [cx + random.randint(-self.screen_width//2, self.screen_width//2), cy - self.screen_height//2 - margin])
+            self.vel = array.array('d', [random.uniform(-1, 1), random.uniform(2, 3)])
         else:  # bottom
-            self.pos = [cx + random.randint(-self.screen_width//2, self.screen_width//2), cy + self.screen_height//2 + margin]
-            self.vel = [random.uniform(-1, 1), -random.uniform(2, 3)]
+            self.pos = array.array('d', [cx + random.randint(-self.screen_width//2, self.screen_width//2), cy + self.screen_height//2 + margin])
+            self.vel = array.array('d', [random.uniform(-1, 1), -random.uniform(2, 3)])
 
     def update(self, player_pos):
         if self.exploding:
@@ -116,8 +140,8 @@ class Saucer:
             self.laser = None
         # Update laser
         if self.laser:
-            self.laser['life'] -= 1
-            if self.laser['life'] <= 0:
+            self.laser.life -= 1
+            if self.laser.life <= 0:
                 self.laser = None
 
     def hit(self):
@@ -125,7 +149,7 @@ class Saucer:
             self.exploding = True
             self.explosion_timer = self.explosion_duration
             if self.explosion_sound:
-                self.explosion_sound.play()
+                AudioScheduler.shared().play('explosion', self.explosion_sound, self.pos, PRIORITY_EXPLOSION)
             self.laser = None
             self.charge = 0
 
@@ -136,16 +160,26 @@ class Saucer:
         dx = self.target_pos[0] - self.pos[0]
         dy = self.target_pos[1] - self.pos[1]
         angle = math.atan2(dx, -dy)
-        self.laser = {
-            'angle': angle,
-            'life': 30,
-        }
+        self.laser = SaucerBeam(angle, 30)
 
-    def draw(self, screen, player_pos):
+    def bounds_radius(self):
+        # Screen-space radius that covers everything draw_body may touch
+        if self.exploding:
+            return int(self.radius * 2.5)
+        return 36
+
+    def beam_segment(self, sx, sy):
+        """Return the beam's screen-space (start, end) for a saucer drawn at (sx, sy), or None."""
+        if not self.laser:
+            return None
+        angle = self.laser.angle
+        start = (sx + math.sin(angle) * self.BEAM_START, sy - math.cos(angle) * self.BEAM_START)
+        end = (sx + math.sin(angle) * self.BEAM_LENGTH, sy - math.cos(angle) * self.BEAM_LENGTH)
+        return start, end
+
+    def draw_body(self, screen, sx, sy):
         if self.exploding:
             # Draw explosion effect
-            sx = self.pos[0] - player_pos[0] + screen.get_width() // 2
-            sy = self.pos[1] - player_pos[1] + screen.get_height() // 2
             t = self.explosion_timer / self.explosion_duration
             radius = int(self.radius * (2.5 - t))
             color = (255, int(200 * t), 0)
@@ -153,9 +187,6 @@ class Saucer:
             pygame.draw.circle(screen, (255, 255, 255), (int(sx), int(sy)), int(radius * 0.6))
             return
 
-        # Draw saucer relative to player (camera)
-        sx = self.pos[0] - player_pos[0] + screen.get_width() // 2
-        sy = self.pos[1] - player_pos[1] + screen.get_height() // 2
         # Saucer body
         pygame.draw.ellipse(screen, (180, 220, 255), (sx - 32, sy - 16, 64, 32))
         pygame.draw.ellipse(screen, (80, 120, 180), (sx - 32, sy - 16, 64, 32), 2)
@@ -167,20 +198,6 @@ class Saucer:
         if self.charge > 0:
             charge_frac = min(1.0, self.charge / self.charge_max)
             pygame.draw.arc(screen, (255, 255, 0), (sx - 36, sy - 20, 72, 40), math.pi, math.pi + math.pi * charge_frac, 4)
-        # Laser
-        if self.laser:
-            angle = self.laser['angle']
-            lx = sx + math.sin(angle) * 32
-            ly = sy - math.cos(angle) * 32
-            end_x = sx + math.sin(angle) * 900
-            end_y = sy - math.cos(angle) * 900
-            pygame.draw.line(screen, (255, 0, 255), (lx, ly), (end_x, end_y), 4)
-            # Glow
-            for i in range(6):
-                alpha = 80 - i * 12
-                color = (255, 0, 255, alpha)
-                # Use pygame.gfxdraw.line for glow effect
-                pygame.gfxdraw.line(screen, int(lx), int(ly), int(end_x), int(end_y), color)
 
     def collides_with_point(self, point):
         """Check if a point (x, y) collides with the saucer's body."""
@@ -2,26 +2,173 @@ import pygame
 import math
 import array
 
+PRIORITY_MOVE = 0
+PRIORITY_LASER = 1
+PRIORITY_EXPLOSION = 2
+
+class Voice:
+    __slots__ = ('name', 'priority', 'distance', 'base_volume', 'channel')
+
+    def __init__(self, name, priority, distance, base_volume, channel):
+        self.name = name
+        self.priority = priority
+        self.distance = distance
+        self.base_volume = base_volume
+        self.channel = channel
+
+class AudioScheduler:
+    """Owns a reserved pool of mixer channels shared by every sound source.
+
+    Each sound name is capped at ``max_per_sound`` concurrent voices. When the
+    cap or the pool is full, the lowest-priority (then farthest) voice is
+    stolen if the new sound outranks it, otherwise the new sound is dropped.
+    Sounds are attenuated linearly with distance from the listener and culled
+    beyond ``hearing_radius``.
+    """
+    _shared = None
+
+    def __init__(self, num_channels=16, max_per_sound=4, hearing_radius=1500, min_volume=0.05):
+        if pygame.mixer.get_num_channels() < num_channels:
+            pygame.mixer.set_num_channels(num_channels)
+        # Reserved channels are never picked by a bare Sound.play() elsewhere
+        pygame.mixer.set_reserved(num_channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self._voices = [None] * num_channels
+        self.max_per_sound = max_per_sound
+        self.hearing_radius = hearing_radius
+        self.min_volume = min_volume
+        self.listener_pos = (0.0, 0.0)
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.last_played = 0
+        self.last_dropped = 0
+        self.last_stolen = 0
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def begin_frame(self, listener_pos):
+        self.listener_pos = (listener_pos[0], listener_pos[1])
+        self.last_played, self.last_dropped, self.last_stolen = self.played, self.dropped, self.stolen
+        self.played = self.dropped = self.stolen = 0
+
+    def play(self, name, sound, pos=None, priority=0, loops=0, base_volume=1.0):
+        """Start ``sound`` at world position ``pos`` (None means at the listener).
+
+        Returns the Voice, or None if the sound was culled or dropped.
+        """
+        distance = self._distance(pos)
+        volume = self._volume(base_volume, distance)
+        if volume < self.min_volume:
+            self.dropped += 1
+            return None
+        self._reap()
+        index = self._pick_channel(name, priority, distance)
+        if index is None:
+            self.dropped += 1
+            return None
+        channel = self._channels[index]
+        voice = Voice(name, priority, distance, base_volume, channel)
+        self._voices[index] = voice
+        channel.play(sound, loops=loops)
+        channel.set_volume(volume)
+        self.played += 1
+        return voice
+
+    def move(self, voice, pos):
+        """Re-attenuate a playing voice; returns False if it no longer owns its channel."""
+        if voice is None or voice not in self._voices:
+            return False
+        voice.distance = self._distance(pos)
+        voice.channel.set_volume(self._volume(voice.base_volume, voice.distance))
+        return True
+
+    def fadeout(self, voice, ms):
+        if voice is not None and voice in self._voices:
+            voice.channel.fadeout(ms)
+            self._voices[self._voices.index(voice)] = None
+
+    def _distance(self, pos):
+        if pos is None:
+            return 0.0
+        return math.hypot(pos[0] - self.listener_pos[0], pos[1] - self.listener_pos[1])
+
+    def _volume(self, base_volume, distance):
+        return base_volume * max(0.0, 1.0 - distance / self.hearing_radius)
+
+    def _reap(self):
+        for i, voice in enumerate(self._voices):
+            if voice is not None and not voice.channel.get_busy():
+                self._voices[i] = None
+
+    def _pick_channel(self, name, priority, distance):
+        same = [i for i, v in enumerate(self._voices) if v is not None and v.name == name]
+        if len(same) >= self.max_per_sound:
+            return self._steal(same, priority, distance)
+        for i, voice in enumerate(self._voices):
+            if voice is None:
+                return i
+        return self._steal(range(len(self._voices)), priority, distance)
+
+    def _steal(self, candidates, priority, distance):
+        # Weakest voice: lowest priority first, then farthest away
+        victim = min(candidates, key=lambda i: (self._voices[i].priority, -self._voices[i].distance))
+        weakest = self._voices[victim]
+        if (priority, -distance) <= (weakest.priority, -weakest.distance):
+            return None
+        self._channels[victim].stop()
+        self._voices[victim] = None
+        self.stolen += 1
+        return victim
+
 class SoundManager:
-    def __init__(self):
-        self.move_sound = self._generate_rumble_sound()
-        self.move_sound.set_volume(0.3)
-        self.laser_sound = self._generate_laser_sound()
-        self.laser_sound.set_volume(0.5)
-        self.move_sound_channel = None
-
-    def play_move(self, active):
+    __slots__ = ('move_sound', 'laser_sound', '_scheduler', '_move_voice', '_move_refused')
+    # Generated sample buffers are shared by every SoundManager
+    _shared_sounds = None
+
+    def __init__(self, scheduler=None):
+        self.move_sound, self.laser_sound = self._load_sounds()
+        self._scheduler = scheduler or AudioScheduler.shared()
+        self._move_voice = None
+        self._move_refused = False
+
+    @classmethod
+    def _load_sounds(cls):
+        if cls._shared_sounds is None:
+            move_sound = cls._generate_rumble_sound()
+            move_sound.set_volume(0.3)
+            laser_sound = cls._generate_laser_sound()
+            laser_sound.set_volume(0.5)
+            cls._shared_sounds = (move_sound, laser_sound)
+        return cls._shared_sounds
+
+    def play_move(self, active, pos=None):
+        # Track the looping voice ourselves rather than polling the channel every frame.
+        # A thruster that was culled, refused or stolen stays silent until thrust is
+        # released, so it isn't retried (and counted as dropped) every frame.
         if active:
-            if self.move_sound_channel is None or not self.move_sound_channel.get_busy():
-                self.move_sound_channel = self.move_sound.play(loops=-1)
+            if self._move_voice is None:
+                if not self._move_refused:
+                    self._move_voice = self._scheduler.play('move', self.move_sound, pos, PRIORITY_MOVE, loops=-1)
+                    self._move_refused = self._move_voice is None
+            elif not self._scheduler.move(self._move_voice, pos):
+                self._move_voice = None
+                self._move_refused = True
         else:
-            if self.move_sound_channel is not None and self.move_sound_channel.get_busy():
-                self.move_sound_channel.fadeout(200)
+            if self._move_voice is not None:
+                self._scheduler.fadeout(self._move_voice, 200)
+                self._move_voice = None
+            self._move_refused = False
 
-    def play_laser(self):
-        self.laser_sound.play()
+    def play_laser(self, pos=None):
+        self._scheduler.play('laser', self.laser_sound, pos, PRIORITY_LASER)
 
-    def _generate_rumble_sound(self):
+    @staticmethod
+    def _generate_rumble_sound():
         sample_rate = 22050
         duration = 0.5
         freq1 = 28
@@ -36,7 +183,8 @@ class SoundManager:
             arr.append(int(32767 * max(-1, min(1, val))))
         return pygame.mixer.Sound(buffer=arr)
 
-    def _generate_laser_sound(self):
+    @staticmethod
+    def _generate_laser_sound():
         sample_rate = 22050
         duration = 0.13
         n_samples = int(sample_rate * duration)